@@ -1,6 +1,6 @@
 """Module contains application settings."""
 
-from typing import Annotated
+from typing import Annotated, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -21,6 +21,56 @@ class Settings(BaseSettings):
     WALLEX_API_KEY: Annotated[str, Field(description="Wallex API Key")]
 
     THRESHOLD: Annotated[float, Field(description="Arbitrage threshold percentage")]
+    STREAM_DECODE: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Extract latest trades without decoding full responses",
+        ),
+    ]
+
+    STREAM_BUFFER_SIZE: Annotated[
+        int,
+        Field(default=256, gt=0, description="Events buffered per stream subscriber"),
+    ]
+
+    SQLITE_PATH: Annotated[
+        str,
+        Field(default="data/arbitrage.db", description="SQLite database file path"),
+    ]
+    STORE_RETENTION_DAYS: Annotated[
+        float,
+        Field(default=30.0, gt=0, description="Days of stored history to retain"),
+    ]
+    QUOTE_SAMPLE_SECONDS: Annotated[
+        float,
+        Field(default=60.0, ge=0, description="Seconds between stored quote samples"),
+    ]
+
+    SNAPSHOT_PATH: Annotated[
+        str,
+        Field(default="data/state.snapshot", description="State snapshot file path"),
+    ]
+    SNAPSHOT_INTERVAL_SECONDS: Annotated[
+        float,
+        Field(default=30.0, gt=0, description="Seconds between state snapshots"),
+    ]
+    SNAPSHOT_MAX_AGE_SECONDS: Annotated[
+        float,
+        Field(
+            default=300.0,
+            ge=0,
+            description="Maximum snapshot age for restoring quotes and opportunities",
+        ),
+    ]
+
+    DEBUG_TOKEN: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Token for profiling endpoints; disabled when unset",
+        ),
+    ]
 
     BOT_API_TOKEN: Annotated[str, Field(description="Telegram Bot API Token")]
     DM_CHAT_ID: Annotated[int, Field(description="Telegram DM Chat ID")]
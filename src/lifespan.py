@@ -1,20 +1,42 @@
 """Module for managing application lifespan events."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI
 
-from src.tasks.base import run_arbitrage_check
-
-scheduler = BackgroundScheduler()
-scheduler.add_job(run_arbitrage_check, "interval", seconds=10)
+from config.base import settings
+from src.storage.sqlite import store
+from src.streaming.broker import broker
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Set application lifespan event manager."""
+    from src.storage.snapshot import restore_snapshot, save_snapshot
+
+    # Restore before importing the scheduler and the trading tasks, which pull
+    # in the HTTP clients, so the restored state is in place as early as possible
+    restore_snapshot()
+
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    from src.tasks.base import run_arbitrage_check
+
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(run_arbitrage_check, "interval", seconds=10)
+    scheduler.add_job(
+        save_snapshot,
+        "interval",
+        seconds=settings.SNAPSHOT_INTERVAL_SECONDS,
+    )
+
+    store.start()
+    broker.bind(asyncio.get_running_loop())
     scheduler.start()
     yield
     scheduler.shutdown()
+    save_snapshot()
+    broker.unbind()
+    store.stop()
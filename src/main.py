@@ -1,10 +1,35 @@
 """Module defines main entry point for the application."""
 
-from fastapi import FastAPI
-from fastapi.responses import PlainTextResponse
+import asyncio
+import hmac
+import time
+from collections.abc import AsyncGenerator
+from contextlib import suppress
+from typing import Annotated, Any, Optional
+
+from fastapi import (
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+)
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.websockets import WebSocketDisconnect
+
+from config.base import settings
 
 from .lifespan import lifespan
 from .monitoring.metrics import metrics
+from .monitoring.profiling import ProfilerBusyError, profile_cpu, trace_allocations
+from .opportunities.index import opportunity_index
+from .storage.sqlite import store
+from .streaming.broker import EVENT_TOPICS, DropPolicy, Subscription, broker
+
+STREAM_HEARTBEAT_SECONDS = 15.0
+WS_HEARTBEAT = '{"event":"heartbeat"}'
 
 app = FastAPI(
     title="Kourosh's Arbitrage Checker",
@@ -13,6 +38,41 @@ app = FastAPI(
 )
 
 
+def _parse_topics(topics: str) -> frozenset[str]:
+    """Parse a comma separated list of stream topics."""
+    requested = frozenset(topic.strip() for topic in topics.split(",") if topic)
+    unknown = requested - EVENT_TOPICS
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid topics {sorted(unknown)}; use {sorted(EVENT_TOPICS)}",
+        )
+    return requested
+
+
+def _require_debug_token(
+    x_debug_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """Allow debug endpoints only when enabled and the token matches."""
+    if settings.DEBUG_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_debug_token is None or not hmac.compare_digest(
+        x_debug_token, settings.DEBUG_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+
+
+async def _receive_until_disconnect(
+    websocket: WebSocket, subscription: Subscription
+) -> None:
+    """Read a websocket until the peer disconnects, then close the subscription."""
+    try:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        subscription.close()
+
+
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
@@ -23,3 +83,122 @@ async def health_check() -> dict[str, str]:
 async def get_metrics() -> str:
     """Prometheus metrics endpoint."""
     return metrics.get_metrics()
+
+
+@app.get("/opportunities")
+async def get_opportunities(
+    top: Annotated[int, Query(ge=1, le=1000)] = 10,
+    min_pct: Annotated[float, Query()] = 0.0,
+) -> list[dict[str, Any]]:
+    """Most profitable live arbitrage opportunities."""
+    return [
+        opportunity.to_dict() for opportunity in opportunity_index.top(top, min_pct)
+    ]
+
+
+@app.get("/analytics")
+def get_analytics(
+    since: Annotated[Optional[float], Query()] = None,
+    until: Annotated[Optional[float], Query()] = None,
+    bucket_pct: Annotated[float, Query(ge=0.01)] = 0.1,
+) -> dict[str, Any]:
+    """Hit rates and profit distribution of stored opportunities."""
+    if not store.running:
+        raise HTTPException(status_code=503, detail="Opportunity store not running")
+    until = time.time() if until is None else until
+    since = until - 86400 if since is None else since
+    if since > until:
+        raise HTTPException(status_code=422, detail="since must not exceed until")
+    return store.get_analytics(since, until, bucket_pct)
+
+
+@app.get("/stream/events")
+async def stream_events(
+    request: Request,
+    topics: Annotated[str, Query()] = ",".join(sorted(EVENT_TOPICS)),
+    policy: Annotated[DropPolicy, Query()] = DropPolicy.DROP_OLDEST,
+) -> StreamingResponse:
+    """Server-Sent Events stream of quotes and arbitrage opportunities."""
+    subscription = broker.subscribe(_parse_topics(topics), policy)
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        try:
+            while not subscription.closed:
+                event = await subscription.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                if await request.is_disconnected():
+                    break
+                yield event.sse if event is not None else ": heartbeat\n\n"
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/stream/ws")
+async def stream_websocket(
+    websocket: WebSocket,
+    topics: str = ",".join(sorted(EVENT_TOPICS)),
+    policy: DropPolicy = DropPolicy.DROP_OLDEST,
+) -> None:
+    """WebSocket stream of quotes and arbitrage opportunities."""
+    try:
+        requested_topics = _parse_topics(topics)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+
+    await websocket.accept()
+    subscription = broker.subscribe(requested_topics, policy)
+    receiver = asyncio.create_task(_receive_until_disconnect(websocket, subscription))
+    disconnected = False
+    try:
+        while not subscription.closed:
+            event = await subscription.get(timeout=STREAM_HEARTBEAT_SECONDS)
+            if event is not None:
+                await websocket.send_text(event.text)
+            elif not subscription.closed:
+                await websocket.send_text(WS_HEARTBEAT)
+    except WebSocketDisconnect:
+        disconnected = True
+    finally:
+        broker.unsubscribe(subscription)
+        peer_connected = not disconnected and not receiver.done()
+        receiver.cancel()
+        with suppress(asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+            # Retrieve the outcome so a failed receive is not logged as unhandled
+            await receiver
+        if peer_connected:
+            # Closed by the broker while the peer is still connected
+            await websocket.close(code=1013, reason="Stream closed")
+
+
+@app.get("/debug/profile", dependencies=[Depends(_require_debug_token)])
+def debug_profile(
+    seconds: Annotated[float, Query(gt=0, le=300)] = 10.0,
+    ticks: Annotated[Optional[int], Query(ge=1, le=100)] = None,
+    interval_ms: Annotated[float, Query(ge=1, le=1000)] = 5.0,
+    thread_prefix: Annotated[Optional[str], Query()] = None,
+    top: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> dict[str, Any]:
+    """Wall-clock sampling profile of the busy threads of the process."""
+    try:
+        return profile_cpu(seconds, ticks, interval_ms / 1000, thread_prefix, top)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@app.get("/debug/allocations", dependencies=[Depends(_require_debug_token)])
+def debug_allocations(
+    seconds: Annotated[float, Query(gt=0, le=300)] = 10.0,
+    ticks: Annotated[Optional[int], Query(ge=1, le=100)] = None,
+    top: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> dict[str, Any]:
+    """Allocation sites that grew the most in the running process."""
+    try:
+        return trace_allocations(seconds, ticks, top)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -1,9 +1,11 @@
 """Module for Prometheus metrics collection."""
 
-from typing import Optional
+from typing import Any, Optional
 
 from prometheus_client import Counter, Gauge, Histogram, generate_latest
 
+from toolkit.quotes import Quote
+
 
 class ArbitrageMetrics:
     """Singleton class for collecting arbitrage-related metrics."""
@@ -59,7 +61,12 @@ class ArbitrageMetrics:
             "Timestamp of the last successful arbitrage check",
         )
 
-        self._latest_prices: dict[str, dict[str, Optional[float]]] = {}
+        self.store_dropped_rows_total = Counter(
+            "store_dropped_rows_total",
+            "Total number of rows dropped because the store queue was full",
+        )
+
+        self._latest_prices: dict[str, dict[str, Quote]] = {}
 
     def record_api_request(
         self,
@@ -95,6 +102,10 @@ class ArbitrageMetrics:
 
         self._update_arbitrage_rate(currency, direction)
 
+    def record_store_drop(self) -> None:
+        """Record a row dropped by the persistent store."""
+        self.store_dropped_rows_total.inc()
+
     def record_arbitrage_check(self) -> None:
         """Record that an arbitrage check was performed."""
         self.arbitrage_checks_total.inc()
@@ -136,12 +147,9 @@ class ArbitrageMetrics:
     def update_latest_prices(
         self,
         exchange: str,
-        currency_prices: dict[str, dict[str, Optional[float]]],
+        currency_prices: dict[str, Quote],
     ) -> None:
         """Update latest prices and calculate differences."""
-        if exchange not in self._latest_prices:
-            self._latest_prices[exchange] = {}
-
         self._latest_prices[exchange] = currency_prices
 
         if len(self._latest_prices) >= 2:
@@ -158,15 +166,15 @@ class ArbitrageMetrics:
         common_currencies = set(exchange1_prices.keys()) & set(exchange2_prices.keys())
 
         for currency in common_currencies:
-            e1_data = exchange1_prices[currency]
-            e2_data = exchange2_prices[currency]
+            e1_quote = exchange1_prices[currency]
+            e2_quote = exchange2_prices[currency]
 
             # Direction 1: exchange1 -> exchange2
             if (
-                e1_data["latest_buy_price"] is not None
-                and e2_data["latest_sell_price"] is not None
+                e1_quote.latest_buy_price is not None
+                and e2_quote.latest_sell_price is not None
             ):
-                diff = e2_data["latest_sell_price"] - e1_data["latest_buy_price"]
+                diff = e2_quote.latest_sell_price - e1_quote.latest_buy_price
                 direction = f"{exchange1}→{exchange2}"
                 self.latest_price_difference.labels(
                     currency=currency, direction=direction
@@ -174,15 +182,67 @@ class ArbitrageMetrics:
 
             # Direction 2: exchange2 -> exchange1
             if (
-                e2_data["latest_buy_price"] is not None
-                and e1_data["latest_sell_price"] is not None
+                e2_quote.latest_buy_price is not None
+                and e1_quote.latest_sell_price is not None
             ):
-                diff = e1_data["latest_sell_price"] - e2_data["latest_buy_price"]
+                diff = e1_quote.latest_sell_price - e2_quote.latest_buy_price
                 direction = f"{exchange2}→{exchange1}"
                 self.latest_price_difference.labels(
                     currency=currency, direction=direction
                 ).set(diff)
 
+    def export_state(self) -> dict[str, Any]:
+        """Export counters and latest prices for warm restarts."""
+        return {
+            "checks_total": self.arbitrage_checks_total._value._value,
+            "last_successful_check": self.last_successful_check._value._value,
+            "opportunities": [
+                (sample.labels["currency"], sample.labels["direction"], sample.value)
+                for sample in self.arbitrage_opportunities_total.collect()[0].samples
+                if sample.name.endswith("_total")
+            ],
+            "latest_prices": [
+                (
+                    exchange,
+                    quote.symbol,
+                    quote.latest_buy_price,
+                    quote.latest_sell_price,
+                )
+                for exchange, quotes in list(self._latest_prices.items())
+                for quote in list(quotes.values())
+            ],
+        }
+
+    def restore_state(self, state: dict[str, Any], restore_prices: bool) -> None:
+        """
+        Restore counters and latest prices exported by `export_state`.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The exported state.
+        restore_prices : bool
+            Whether latest prices are recent enough to be restored.
+        """
+        self.arbitrage_checks_total.inc(state["checks_total"])
+        self.last_successful_check.set(state["last_successful_check"])
+
+        for currency, direction, value in state["opportunities"]:
+            self.arbitrage_opportunities_total.labels(
+                currency=currency, direction=direction
+            ).inc(value)
+
+        if restore_prices:
+            latest_prices: dict[str, dict[str, Quote]] = {}
+            for exchange, currency, buy_price, sell_price in state["latest_prices"]:
+                latest_prices.setdefault(exchange, {})[currency] = Quote(
+                    currency, buy_price, sell_price
+                )
+            for exchange, currency_prices in latest_prices.items():
+                self.update_latest_prices(exchange, currency_prices)
+
+        self._update_all_arbitrage_rates()
+
     def get_metrics(self) -> str:
         """Get Prometheus metrics in text format."""
         return generate_latest().decode("utf-8")
@@ -0,0 +1,294 @@
+"""Module for on-demand CPU and allocation profiling of the running service."""
+
+import asyncio.base_events
+import asyncio.runners
+import concurrent.futures.thread
+import queue
+import selectors
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Optional
+
+from .metrics import metrics
+
+MAX_PROFILE_SECONDS = 300.0
+TRACEMALLOC_FRAMES = 10
+
+_session_lock = threading.Lock()
+
+# Top frames of threads parked in a blocking wait rather than doing work
+IDLE_FRAMES = frozenset(
+    {
+        (threading.__file__, "wait"),
+        (threading.__file__, "_wait_for_tstate_lock"),
+        (queue.__file__, "get"),
+        (selectors.__file__, "select"),
+        (concurrent.futures.thread.__file__, "_worker"),
+        (asyncio.base_events.__file__, "run_forever"),
+        (asyncio.base_events.__file__, "run_until_complete"),
+        (asyncio.runners.__file__, "run"),
+    }
+)
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profiling session is already running."""
+
+
+def _wait(seconds: Optional[float], ticks: Optional[int]) -> float:
+    """
+    Block for a number of seconds or arbitrage checks.
+
+    Parameters
+    ----------
+    seconds : Optional[float]
+        Seconds to wait; ignored when `ticks` is given.
+    ticks : Optional[int]
+        Number of completed arbitrage checks to wait for.
+
+    Returns
+    -------
+    float
+        The elapsed time in seconds.
+    """
+    start = time.monotonic()
+    if ticks is None:
+        time.sleep(min(seconds or 0.0, MAX_PROFILE_SECONDS))
+    else:
+        target = metrics.arbitrage_checks_total._value._value + ticks
+        deadline = start + MAX_PROFILE_SECONDS
+        while (
+            metrics.arbitrage_checks_total._value._value < target
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.1)
+    return time.monotonic() - start
+
+
+def _run_exclusive(func, *args) -> Any:
+    """Run a profiling session unless another one is in progress."""
+    if not _session_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profiling session is already running")
+    try:
+        return func(*args)
+    finally:
+        _session_lock.release()
+
+
+def _sample_stacks(
+    stop: threading.Event,
+    caller_id: int,
+    interval: float,
+    thread_prefix: Optional[str],
+    self_counts: Counter,
+    total_counts: Counter,
+    totals: Counter,
+) -> None:
+    """Sample the stacks of busy threads until stopped."""
+    skipped_ids = {threading.get_ident(), caller_id}
+    while not stop.wait(interval):
+        thread_names = (
+            {thread.ident: thread.name for thread in threading.enumerate()}
+            if thread_prefix is not None
+            else {}
+        )
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in skipped_ids:
+                continue
+            if thread_prefix is not None and not thread_names.get(
+                thread_id, ""
+            ).startswith(thread_prefix):
+                continue
+            code = frame.f_code
+            if (code.co_filename, code.co_name) in IDLE_FRAMES:
+                totals["idle"] += 1
+                continue
+            totals["busy"] += 1
+            self_counts[(code.co_filename, frame.f_lineno, code.co_name)] += 1
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if key not in seen:
+                    seen.add(key)
+                    total_counts[key] += 1
+                frame = frame.f_back
+
+
+def _profile_cpu(
+    seconds: Optional[float],
+    ticks: Optional[int],
+    interval: float,
+    thread_prefix: Optional[str],
+    top: int,
+) -> dict[str, Any]:
+    """Run a wall-clock sampling profile and summarize the hottest frames."""
+    stop = threading.Event()
+    self_counts: Counter = Counter()
+    total_counts: Counter = Counter()
+    totals: Counter = Counter()
+    sampler = threading.Thread(
+        target=_sample_stacks,
+        args=(
+            stop,
+            threading.get_ident(),
+            interval,
+            thread_prefix,
+            self_counts,
+            total_counts,
+            totals,
+        ),
+        name="cpu-profiler",
+        daemon=True,
+    )
+    sampler.start()
+    try:
+        elapsed = _wait(seconds, ticks)
+    finally:
+        stop.set()
+        sampler.join()
+
+    samples = totals["busy"] or 1
+
+    def _rows(counts: Counter, line_key: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "function": function,
+                "file": filename,
+                line_key: line,
+                "samples": count,
+                "percentage": count / samples * 100,
+            }
+            for (filename, line, function), count in counts.most_common(top)
+        ]
+
+    return {
+        "elapsed_seconds": elapsed,
+        "clock": "wall",
+        "wall_clock_samples": totals["busy"],
+        "idle_samples_skipped": totals["idle"],
+        # Self rows point at the executing line, cumulative rows at the
+        # first line of the function they aggregate
+        "self": _rows(self_counts, "line"),
+        "cumulative": _rows(total_counts, "first_line"),
+    }
+
+
+def _trace_allocations(
+    seconds: Optional[float],
+    ticks: Optional[int],
+    top: int,
+) -> dict[str, Any]:
+    """Trace allocations and summarize the sites that grew the most."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        before = tracemalloc.take_snapshot()
+        elapsed = _wait(seconds, ticks)
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    return {
+        "elapsed_seconds": elapsed,
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "allocations": [
+            {
+                "file": stat.traceback[0].filename,
+                "line": stat.traceback[0].lineno,
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:top]
+        ],
+    }
+
+
+def profile_cpu(
+    seconds: Optional[float] = None,
+    ticks: Optional[int] = None,
+    interval: float = 0.005,
+    thread_prefix: Optional[str] = None,
+    top: int = 20,
+) -> dict[str, Any]:
+    """
+    Sample the wall-clock stacks of busy threads for a while.
+
+    Samples whose top frame is a known blocking wait (idle event loop,
+    worker pools and scheduler waits) are skipped, so the profile shows
+    where working threads spend their time. Nothing runs between sessions;
+    the sampler thread only exists while a session is in progress.
+
+    Parameters
+    ----------
+    seconds : Optional[float]
+        Seconds to profile for; ignored when `ticks` is given.
+    ticks : Optional[int]
+        Number of arbitrage checks to profile for.
+    interval : float
+        Seconds between stack samples.
+    thread_prefix : Optional[str]
+        Only sample threads whose name starts with this prefix, e.g.
+        'ThreadPoolExecutor' for the scheduler workers running the ticks.
+    top : int
+        Number of frames to return.
+
+    Returns
+    -------
+    dict[str, Any]
+        The hottest frames by self and cumulative wall-clock samples.
+
+    Raises
+    ------
+    ProfilerBusyError
+        If another profiling session is running.
+    """
+    return _run_exclusive(_profile_cpu, seconds, ticks, interval, thread_prefix, top)
+
+
+def trace_allocations(
+    seconds: Optional[float] = None,
+    ticks: Optional[int] = None,
+    top: int = 20,
+) -> dict[str, Any]:
+    """
+    Trace memory allocations for a while with `tracemalloc`.
+
+    Tracing is only enabled for the duration of the session.
+
+    Parameters
+    ----------
+    seconds : Optional[float]
+        Seconds to trace for; ignored when `ticks` is given.
+    ticks : Optional[int]
+        Number of arbitrage checks to trace for.
+    top : int
+        Number of allocation sites to return.
+
+    Returns
+    -------
+    dict[str, Any]
+        The allocation sites whose memory grew the most.
+
+    Raises
+    ------
+    ProfilerBusyError
+        If another profiling session is running.
+    """
+    return _run_exclusive(_trace_allocations, seconds, ticks, top)
@@ -0,0 +1,96 @@
+"""Module for ranking live arbitrage opportunities."""
+
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+
+from toolkit.quotes import Opportunity
+
+OpportunityKey = tuple[int, str]
+_SortKey = tuple[float, int, str]
+
+
+class OpportunityIndex:
+    """Live opportunities keyed by (currency, direction), ranked by profit."""
+
+    def __init__(self):
+        """Initialize index."""
+        self._entries: dict[OpportunityKey, tuple[_SortKey, Opportunity]] = {}
+        self._ranking: list[_SortKey] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of live opportunities."""
+        return len(self._entries)
+
+    def update(self, opportunity: Opportunity) -> None:
+        """Insert or replace the opportunity of its (currency, direction) pair."""
+        key = (opportunity.symbol_id, opportunity.direction)
+        sort_key = (-opportunity.profit_percentage, *key)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                if previous[0] != sort_key:
+                    self._remove_ranking(previous[0])
+                    insort(self._ranking, sort_key)
+            else:
+                insort(self._ranking, sort_key)
+            self._entries[key] = (sort_key, opportunity)
+
+    def discard(self, symbol_id: int, direction: str) -> None:
+        """Remove the opportunity of a pair if it is present."""
+        with self._lock:
+            previous = self._entries.pop((symbol_id, direction), None)
+            if previous is not None:
+                self._remove_ranking(previous[0])
+
+    def retain(self, symbol_ids: Iterable[int]) -> None:
+        """Remove opportunities of every currency not listed."""
+        keep = set(symbol_ids)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] not in keep]:
+                self._remove_ranking(self._entries.pop(key)[0])
+
+    def clear(self) -> None:
+        """Remove all opportunities."""
+        with self._lock:
+            self._entries.clear()
+            self._ranking.clear()
+
+    def top(self, k: int, min_pct: float = 0.0) -> list[Opportunity]:
+        """
+        Get the most profitable opportunities.
+
+        Parameters
+        ----------
+        k : int
+            Maximum number of opportunities to return.
+        min_pct : float
+            Minimum profit percentage of returned opportunities.
+
+        Returns
+        -------
+        list[Opportunity]
+            Opportunities ordered by descending profit percentage.
+        """
+        result = []
+        with self._lock:
+            for sort_key in self._ranking:
+                if len(result) >= k or -sort_key[0] < min_pct:
+                    break
+                result.append(self._entries[sort_key[1:]][1])
+        return result
+
+    def snapshot(self) -> list[Opportunity]:
+        """Get all live opportunities ordered by descending profit percentage."""
+        with self._lock:
+            return [self._entries[sort_key[1:]][1] for sort_key in self._ranking]
+
+    def _remove_ranking(self, sort_key: _SortKey) -> None:
+        """Remove a sort key from the ranking; caller must hold the lock."""
+        position = bisect_left(self._ranking, sort_key)
+        del self._ranking[position]
+
+
+# Global opportunity index instance
+opportunity_index = OpportunityIndex()
@@ -0,0 +1,159 @@
+"""Module for snapshotting in-memory state across restarts."""
+
+import marshal
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from config.base import logger, settings
+from src.monitoring.metrics import metrics
+from src.opportunities.index import opportunity_index
+from toolkit.quotes import Opportunity
+
+SNAPSHOT_VERSION = 1
+
+_NUMBER = (int, float)
+_OPTIONAL_NUMBER = (int, float, type(None))
+
+
+def save_snapshot(path: str = settings.SNAPSHOT_PATH) -> None:
+    """
+    Write the in-memory state to a binary snapshot file.
+
+    The snapshot is written to a temporary file first and atomically moved
+    into place, so a crash never leaves a truncated snapshot behind.
+
+    Parameters
+    ----------
+    path : str
+        The snapshot file path.
+    """
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "saved_at": time.time(),
+        "metrics": metrics.export_state(),
+        "opportunities": [
+            (
+                opportunity.currency,
+                opportunity.direction,
+                opportunity.buy_price,
+                opportunity.sell_price,
+                opportunity.profit,
+                opportunity.profit_percentage,
+                opportunity.detected_at,
+            )
+            for opportunity in opportunity_index.snapshot()
+        ],
+    }
+
+    snapshot_path = Path(path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = snapshot_path.with_suffix(snapshot_path.suffix + ".tmp")
+    try:
+        temp_path.write_bytes(marshal.dumps(state))
+        os.replace(temp_path, snapshot_path)
+    except OSError as e:
+        logger.error(f"Error saving state snapshot: {e}")
+
+
+def restore_snapshot(
+    path: str = settings.SNAPSHOT_PATH,
+    max_age: float = settings.SNAPSHOT_MAX_AGE_SECONDS,
+) -> bool:
+    """
+    Restore the in-memory state from a snapshot file.
+
+    Counters are always restored, while quotes and live opportunities are
+    only restored when the snapshot is younger than `max_age`.
+
+    Parameters
+    ----------
+    path : str
+        The snapshot file path.
+    max_age : float
+        Maximum snapshot age in seconds for restoring quotes and opportunities.
+
+    Returns
+    -------
+    bool
+        True if a snapshot was restored.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.error(f"Error reading state snapshot: {e}")
+        return False
+
+    try:
+        state = marshal.loads(data)
+        _validate_state(state)
+
+        age = time.time() - state["saved_at"]
+        is_recent = age <= max_age
+        opportunities = (
+            [Opportunity(*fields) for fields in state["opportunities"]]
+            if is_recent
+            else []
+        )
+
+        metrics.restore_state(state["metrics"], restore_prices=is_recent)
+        for opportunity in opportunities:
+            opportunity_index.update(opportunity)
+    except Exception as e:
+        logger.error(f"Ignoring invalid state snapshot, starting cold: {e}")
+        opportunity_index.clear()
+        return False
+
+    logger.info(
+        f"Restored state snapshot from {age:.1f}s ago"
+        f"{'' if is_recent else ' (counters only)'}"
+    )
+    return True
+
+
+def _check_rows(rows: Any, types: tuple) -> None:
+    """Check that rows are a list of tuples matching the given field types."""
+    if not isinstance(rows, list):
+        raise ValueError("Expected a list of rows")
+    for row in rows:
+        if (
+            not isinstance(row, tuple)
+            or len(row) != len(types)
+            or not all(map(isinstance, row, types))
+        ):
+            raise ValueError(f"Malformed snapshot row {row!r}")
+
+
+def _validate_state(state: Any) -> None:
+    """
+    Check the shape of a decoded snapshot before anything is restored.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot version or shape is not supported.
+    """
+    if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+        raise ValueError("unsupported snapshot version")
+    if not isinstance(state.get("saved_at"), _NUMBER):
+        raise ValueError("missing snapshot timestamp")
+
+    metrics_state = state.get("metrics")
+    if not isinstance(metrics_state, dict):
+        raise ValueError("missing metrics state")
+    for key in ("checks_total", "last_successful_check"):
+        if not isinstance(metrics_state.get(key), _NUMBER):
+            raise ValueError(f"missing metrics field {key!r}")
+    _check_rows(metrics_state.get("opportunities"), (str, str, _NUMBER))
+    if metrics_state["checks_total"] < 0 or any(
+        value < 0 for _, _, value in metrics_state["opportunities"]
+    ):
+        raise ValueError("negative counter value")
+    _check_rows(
+        metrics_state.get("latest_prices"),
+        (str, str, _OPTIONAL_NUMBER, _OPTIONAL_NUMBER),
+    )
+    _check_rows(state.get("opportunities"), (str, str, *(_NUMBER,) * 5))
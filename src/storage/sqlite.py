@@ -0,0 +1,327 @@
+"""Module for persisting opportunities and sampled quotes in SQLite."""
+
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from config.base import logger, settings
+from src.monitoring.metrics import metrics
+from toolkit.quotes import Opportunity, Quote
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 1.0
+PRUNE_INTERVAL_SECONDS = 3600.0
+QUEUE_SIZE = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS opportunities (
+    id INTEGER PRIMARY KEY,
+    detected_at REAL NOT NULL,
+    currency TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    buy_price REAL NOT NULL,
+    sell_price REAL NOT NULL,
+    profit REAL NOT NULL,
+    profit_percentage REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_opportunities_pair_time
+    ON opportunities (currency, direction, detected_at);
+CREATE INDEX IF NOT EXISTS ix_opportunities_time
+    ON opportunities (detected_at);
+
+CREATE TABLE IF NOT EXISTS quotes (
+    id INTEGER PRIMARY KEY,
+    sampled_at REAL NOT NULL,
+    exchange TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    latest_buy_price REAL,
+    latest_sell_price REAL
+);
+CREATE INDEX IF NOT EXISTS ix_quotes_currency_time
+    ON quotes (currency, exchange, sampled_at);
+CREATE INDEX IF NOT EXISTS ix_quotes_time
+    ON quotes (sampled_at);
+
+CREATE TABLE IF NOT EXISTS checks (
+    checked_at REAL PRIMARY KEY
+);
+"""
+
+INSERT_OPPORTUNITY = (
+    "INSERT INTO opportunities (detected_at, currency, direction, buy_price, "
+    "sell_price, profit, profit_percentage) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_QUOTE = (
+    "INSERT INTO quotes (sampled_at, exchange, currency, latest_buy_price, "
+    "latest_sell_price) VALUES (?, ?, ?, ?, ?)"
+)
+INSERT_CHECK = "INSERT OR IGNORE INTO checks (checked_at) VALUES (?)"
+
+_STOP = object()
+
+
+class OpportunityStore:
+    """SQLite store fed by a background writer thread."""
+
+    def __init__(
+        self,
+        path: str,
+        retention_days: float,
+        quote_sample_seconds: float,
+    ):
+        """Initialize store."""
+        self.path = path
+        self.retention_days = retention_days
+        self.quote_sample_seconds = quote_sample_seconds
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._last_quote_sample: dict[str, float] = {}
+
+    @property
+    def running(self) -> bool:
+        """Check whether the background writer is running."""
+        return self._writer is not None and self._writer.is_alive()
+
+    def start(self) -> None:
+        """Create the schema and start the background writer."""
+        if self.running:
+            return
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        connection.executescript(SCHEMA)
+        self._writer = threading.Thread(
+            target=self._run_writer,
+            args=(connection,),
+            name="sqlite-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def stop(self) -> None:
+        """Flush pending rows and stop the background writer."""
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+
+    def record_quotes(self, exchange: str, quotes: dict[str, Quote]) -> None:
+        """Queue quotes of an exchange if its sampling interval has elapsed."""
+        now = time.time()
+        if now - self._last_quote_sample.get(exchange, 0.0) < (
+            self.quote_sample_seconds
+        ):
+            return
+        self._last_quote_sample[exchange] = now
+        for quote in quotes.values():
+            self._enqueue(
+                INSERT_QUOTE,
+                (
+                    now,
+                    exchange,
+                    quote.symbol,
+                    quote.latest_buy_price,
+                    quote.latest_sell_price,
+                ),
+            )
+
+    def record_check(self, checked_at: float, opportunities: list[Opportunity]) -> None:
+        """
+        Queue a completed arbitrage check and the opportunities it alerted.
+
+        Storing both together keeps every stored opportunity backed by a
+        stored check, so hit rates stay within [0, 1].
+
+        Parameters
+        ----------
+        checked_at : float
+            Completion time of the check as a UNIX timestamp.
+        opportunities : list[Opportunity]
+            Opportunities alerted during the check.
+        """
+        self._enqueue(INSERT_CHECK, (checked_at,))
+        for opportunity in opportunities:
+            self._enqueue(
+                INSERT_OPPORTUNITY,
+                (
+                    opportunity.detected_at,
+                    opportunity.currency,
+                    opportunity.direction,
+                    opportunity.buy_price,
+                    opportunity.sell_price,
+                    opportunity.profit,
+                    opportunity.profit_percentage,
+                ),
+            )
+
+    def get_analytics(
+        self,
+        since: float,
+        until: float,
+        bucket_pct: float,
+    ) -> dict[str, Any]:
+        """
+        Summarize stored opportunities over a time window.
+
+        Parameters
+        ----------
+        since : float
+            Window start as a UNIX timestamp.
+        until : float
+            Window end as a UNIX timestamp.
+        bucket_pct : float
+            Width of the profit percentage histogram buckets, rounded to
+            whole basis points.
+
+        Returns
+        -------
+        dict[str, Any]
+            Number of checks, rows dropped since startup because the write
+            queue was full, per pair hit rates and profit statistics, and the
+            profit percentage distribution within the window.
+        """
+        # Buckets are computed in integer basis points, so exact boundaries
+        # such as 0.3% never fall into the lower bucket through float error.
+        bucket_bp = max(1, round(bucket_pct * 100))
+        connection = self._connect()
+        try:
+            checks = connection.execute(
+                "SELECT COUNT(*) FROM checks WHERE checked_at BETWEEN ? AND ?",
+                (since, until),
+            ).fetchone()[0]
+            pair_rows = connection.execute(
+                "SELECT currency, direction, COUNT(*), MIN(profit_percentage), "
+                "AVG(profit_percentage), MAX(profit_percentage), SUM(profit) "
+                "FROM opportunities WHERE detected_at BETWEEN ? AND ? "
+                "GROUP BY currency, direction ORDER BY COUNT(*) DESC",
+                (since, until),
+            ).fetchall()
+            bucket_rows = connection.execute(
+                "SELECT CAST(ROUND(profit_percentage * 100) AS INTEGER) / ? "
+                "AS bucket, COUNT(*) "
+                "FROM opportunities WHERE detected_at BETWEEN ? AND ? "
+                "GROUP BY bucket ORDER BY bucket",
+                (bucket_bp, since, until),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        return {
+            "since": since,
+            "until": until,
+            "checks": checks,
+            "dropped_rows": self.dropped,
+            "pairs": [
+                {
+                    "currency": currency,
+                    "direction": direction,
+                    "opportunities": count,
+                    # Checks are stamped at tick end, so a window edge can cut a
+                    # check off from opportunities detected just before it
+                    "hit_rate": min(1.0, count / checks) if checks else 0.0,
+                    "min_profit_percentage": min_pct,
+                    "avg_profit_percentage": avg_pct,
+                    "max_profit_percentage": max_pct,
+                    "total_profit": total_profit,
+                }
+                for (
+                    currency,
+                    direction,
+                    count,
+                    min_pct,
+                    avg_pct,
+                    max_pct,
+                    total_profit,
+                ) in pair_rows
+            ],
+            "distribution": [
+                {
+                    "lower_pct": bucket * bucket_bp / 100,
+                    "upper_pct": (bucket + 1) * bucket_bp / 100,
+                    "count": count,
+                }
+                for bucket, count in bucket_rows
+            ],
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in WAL mode."""
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _enqueue(self, statement: str, row: tuple) -> None:
+        """Queue a row without ever blocking the caller."""
+        if not self.running:
+            return
+        try:
+            self._queue.put_nowait((statement, row))
+        except queue.Full:
+            self.dropped += 1
+            metrics.record_store_drop()
+
+    def _run_writer(self, connection: sqlite3.Connection) -> None:
+        """Write queued rows in batches until stopped."""
+        next_prune = 0.0
+        stopping = False
+        try:
+            while not stopping:
+                batch: dict[str, list[tuple]] = {}
+                try:
+                    item = self._queue.get(timeout=FLUSH_INTERVAL_SECONDS)
+                    for size in range(1, BATCH_SIZE + 1):
+                        if item is _STOP:
+                            stopping = True
+                            break
+                        statement, row = item
+                        batch.setdefault(statement, []).append(row)
+                        if size < BATCH_SIZE:
+                            item = self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+                if batch:
+                    self._write_batch(connection, batch)
+
+                if time.time() >= next_prune:
+                    self._prune(connection)
+                    next_prune = time.time() + PRUNE_INTERVAL_SECONDS
+        finally:
+            connection.close()
+
+    def _write_batch(
+        self, connection: sqlite3.Connection, batch: dict[str, list[tuple]]
+    ) -> None:
+        """Write a batch of rows in a single transaction."""
+        try:
+            with connection:
+                for statement, rows in batch.items():
+                    connection.executemany(statement, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error writing {sum(map(len, batch.values()))} rows: {e}")
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        """Delete rows older than the retention period."""
+        cutoff = time.time() - self.retention_days * 86400
+        try:
+            with connection:
+                connection.execute(
+                    "DELETE FROM opportunities WHERE detected_at < ?", (cutoff,)
+                )
+                connection.execute("DELETE FROM quotes WHERE sampled_at < ?", (cutoff,))
+                connection.execute("DELETE FROM checks WHERE checked_at < ?", (cutoff,))
+        except sqlite3.Error as e:
+            logger.error(f"Error pruning stored data: {e}")
+
+
+# Global store instance
+store = OpportunityStore(
+    path=settings.SQLITE_PATH,
+    retention_days=settings.STORE_RETENTION_DAYS,
+    quote_sample_seconds=settings.QUOTE_SAMPLE_SECONDS,
+)
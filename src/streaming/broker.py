@@ -0,0 +1,181 @@
+"""Module for fanning out live events to streaming subscribers."""
+
+import asyncio
+import json
+from collections import deque
+from enum import Enum
+from typing import Any, Optional
+
+from config.base import logger, settings
+
+QUOTE_EVENT = "quote"
+OPPORTUNITY_EVENT = "opportunity"
+EVENT_TOPICS = frozenset({QUOTE_EVENT, OPPORTUNITY_EVENT})
+
+
+class DropPolicy(str, Enum):
+    """Policy applied when a subscriber buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+class Event:
+    """Event encoded once and shared by every subscriber."""
+
+    __slots__ = ("topic", "sse", "text")
+
+    def __init__(self, topic: str, payload: dict[str, Any]):
+        data = json.dumps(payload, separators=(",", ":"))
+        self.topic = topic
+        self.sse = f"event: {topic}\ndata: {data}\n\n"
+        self.text = f'{{"event":"{topic}","data":{data}}}'
+
+
+class Subscription:
+    """Bounded event buffer of a single streaming consumer."""
+
+    __slots__ = (
+        "topics",
+        "policy",
+        "maxlen",
+        "dropped",
+        "closed",
+        "_buffer",
+        "_ready",
+    )
+
+    def __init__(self, topics: frozenset[str], policy: DropPolicy, maxlen: int):
+        self.topics = topics
+        self.policy = policy
+        self.maxlen = maxlen
+        self.dropped = 0
+        self.closed = False
+        self._buffer: deque[Event] = deque()
+        self._ready = asyncio.Event()
+
+    def offer(self, event: Event) -> None:
+        """Buffer an event, applying the drop policy when the buffer is full."""
+        if len(self._buffer) >= self.maxlen:
+            self.dropped += 1
+            if self.policy is DropPolicy.DROP_NEWEST:
+                return
+            if self.policy is DropPolicy.DISCONNECT:
+                self.close()
+                return
+            self._buffer.popleft()
+        self._buffer.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Close the subscription and wake up its consumer."""
+        self.closed = True
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """
+        Wait for the next event.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Seconds to wait before giving up.
+
+        Returns
+        -------
+        Optional[Event]
+            The next event, or None on timeout or when the subscription closed.
+        """
+        if not self._buffer and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self.closed or not self._buffer:
+            return None
+        return self._buffer.popleft()
+
+
+class EventBroker:
+    """Broker publishing detector events to streaming subscribers."""
+
+    def __init__(self, buffer_size: int):
+        """Initialize broker."""
+        self.buffer_size = buffer_size
+        self._subscriptions: set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of active subscriptions."""
+        return len(self._subscriptions)
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the broker to the event loop serving the subscribers."""
+        self._loop = loop
+
+    def unbind(self) -> None:
+        """Close all subscriptions and detach from the event loop."""
+        for subscription in tuple(self._subscriptions):
+            subscription.close()
+        self._subscriptions.clear()
+        self._loop = None
+
+    def subscribe(
+        self,
+        topics: frozenset[str] = EVENT_TOPICS,
+        policy: DropPolicy = DropPolicy.DROP_OLDEST,
+    ) -> Subscription:
+        """Register a new subscription; must be called on the bound loop."""
+        subscription = Subscription(topics, policy, self.buffer_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription; must be called on the bound loop."""
+        self._subscriptions.discard(subscription)
+        if subscription.dropped:
+            logger.warning(
+                f"Stream subscriber dropped {subscription.dropped} events "
+                f"({subscription.policy.value})"
+            )
+
+    def publish(self, topic: str, payloads: list[dict[str, Any]]) -> None:
+        """
+        Publish events from any thread.
+
+        Payloads are encoded once here, off the event loop, and handed over in
+        a single loop callback; nothing is encoded while nobody is listening.
+
+        Parameters
+        ----------
+        topic : str
+            The event topic.
+        payloads : list[dict[str, Any]]
+            The event payloads, in order.
+        """
+        loop = self._loop
+        if loop is None or not self._subscriptions or not payloads:
+            return
+        events = [Event(topic, payload) for payload in payloads]
+        try:
+            loop.call_soon_threadsafe(self._fan_out, events)
+        except RuntimeError:
+            # Loop already closed during shutdown
+            pass
+
+    def _fan_out(self, events: list[Event]) -> None:
+        """Deliver events to every interested subscription."""
+        for subscription in tuple(self._subscriptions):
+            if subscription.closed:
+                self._subscriptions.discard(subscription)
+                continue
+            for event in events:
+                if event.topic in subscription.topics:
+                    subscription.offer(event)
+
+
+# Global broker instance
+broker = EventBroker(buffer_size=settings.STREAM_BUFFER_SIZE)
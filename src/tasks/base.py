@@ -1,9 +1,14 @@
 """Module defines base recurring tasks for trading operations."""
 
+import time
 from typing import Optional
 
 from config.base import logger, settings
 from src.monitoring.metrics import metrics
+from src.opportunities.index import opportunity_index
+from src.storage.sqlite import store
+from src.streaming.broker import OPPORTUNITY_EVENT, QUOTE_EVENT, broker
+from toolkit.quotes import Opportunity, Quote, intern_symbol
 from toolkit.telegram import get_telegram_client
 
 from .nobitex import run_nobitex_trades_retrieval
@@ -18,10 +23,13 @@ def _check_and_send_arbitrage_alert(
     direction: str,
     threshold: float,
     telegram_client,
-) -> None:
+) -> Optional[Opportunity]:
     """
     Check if arbitrage opportunity exists and send alert if profitable.
 
+    Every positive spread is kept in the opportunity index, while alerts are
+    only sent for spreads above the threshold.
+
     Parameters
     ----------
     currency : str
@@ -36,22 +44,54 @@ def _check_and_send_arbitrage_alert(
         Minimum profit percentage threshold to trigger alert
     telegram_client
         Telegram client instance for sending messages
+
+    Returns
+    -------
+    Optional[Opportunity]
+        The opportunity if an alert was sent, otherwise None
     """
-    if buy_price is not None and sell_price is not None and sell_price > buy_price:
-        profit, profit_percentage = calculate_profit(buy_price, sell_price)
+    if buy_price is None or sell_price is None or sell_price <= buy_price:
+        opportunity_index.discard(intern_symbol(currency), direction)
+        return None
+
+    profit, profit_percentage = calculate_profit(buy_price, sell_price)
+    opportunity = Opportunity(
+        currency=currency,
+        direction=direction,
+        buy_price=buy_price,
+        sell_price=sell_price,
+        profit=profit,
+        profit_percentage=profit_percentage,
+        detected_at=time.time(),
+    )
+    opportunity_index.update(opportunity)
+
+    if profit_percentage >= threshold:
+        logger.info(f"Arbitrage opportunity found for {currency}: {direction}")
+
+        metrics.record_arbitrage_opportunity(currency, direction, profit)
+
+        broker.publish(OPPORTUNITY_EVENT, [opportunity.to_dict()])
+
+        telegram_client.send_message(
+            currency=f"{currency} ({direction})",
+            buy_price=buy_price,
+            sell_price=sell_price,
+            profit_percentage=profit_percentage,
+            profit_difference=profit,
+        )
+        return opportunity
 
-        if profit_percentage >= threshold:
-            logger.info(f"Arbitrage opportunity found for {currency}: {direction}")
+    return None
 
-            metrics.record_arbitrage_opportunity(currency, direction, profit)
 
-            telegram_client.send_message(
-                currency=f"{currency} ({direction})",
-                buy_price=buy_price,
-                sell_price=sell_price,
-                profit_percentage=profit_percentage,
-                profit_difference=profit,
-            )
+def _publish_quotes(exchange: str, quotes: dict[str, Quote]) -> None:
+    """Publish the latest quotes of an exchange to stream subscribers."""
+    if broker.subscriber_count:
+        broker.publish(
+            QUOTE_EVENT,
+            [{"exchange": exchange, **quote.to_dict()} for quote in quotes.values()],
+        )
 
 
 def check_for_arbitrage_opportunities() -> None:
@@ -62,15 +102,23 @@ def check_for_arbitrage_opportunities() -> None:
 
         if not nobitex_trades or not wallex_trades:
             logger.warning("Failed to retrieve trade data from one or both exchanges")
+            opportunity_index.clear()
             return
 
         metrics.update_latest_prices("nobitex", nobitex_trades)
         metrics.update_latest_prices("wallex", wallex_trades)
 
+        _publish_quotes("nobitex", nobitex_trades)
+        _publish_quotes("wallex", wallex_trades)
+
+        store.record_quotes("nobitex", nobitex_trades)
+        store.record_quotes("wallex", wallex_trades)
+
         common_currencies = set(nobitex_trades.keys()) & set(wallex_trades.keys())
 
         if not common_currencies:
             logger.info("No common currencies found between exchanges")
+            opportunity_index.clear()
             return
 
         telegram_client = get_telegram_client()
@@ -81,36 +129,49 @@ def check_for_arbitrage_opportunities() -> None:
             f" currencies with threshold {threshold}%"
         )
 
+        alerted: list[Opportunity] = []
         for currency in common_currencies:
-            nobitex_data = nobitex_trades[currency]
-            wallex_data = wallex_trades[currency]
+            nobitex_quote = nobitex_trades[currency]
+            wallex_quote = wallex_trades[currency]
 
             # Check arbitrage opportunity 1: Buy on Nobitex, Sell on Wallex
-            _check_and_send_arbitrage_alert(
+            opportunity = _check_and_send_arbitrage_alert(
                 currency=currency,
-                buy_price=nobitex_data["latest_buy_price"],
-                sell_price=wallex_data["latest_sell_price"],
+                buy_price=nobitex_quote.latest_buy_price,
+                sell_price=wallex_quote.latest_sell_price,
                 direction="Nobitex→Wallex",
                 threshold=threshold,
                 telegram_client=telegram_client,
             )
+            if opportunity is not None:
+                alerted.append(opportunity)
 
             # Check arbitrage opportunity 2: Buy on Wallex, Sell on Nobitex
-            _check_and_send_arbitrage_alert(
+            opportunity = _check_and_send_arbitrage_alert(
                 currency=currency,
-                buy_price=wallex_data["latest_buy_price"],
-                sell_price=nobitex_data["latest_sell_price"],
+                buy_price=wallex_quote.latest_buy_price,
+                sell_price=nobitex_quote.latest_sell_price,
                 direction="Wallex→Nobitex",
                 threshold=threshold,
                 telegram_client=telegram_client,
             )
+            if opportunity is not None:
+                alerted.append(opportunity)
+
+        opportunity_index.retain(
+            intern_symbol(currency) for currency in common_currencies
+        )
 
         metrics.record_arbitrage_check()
+        # Opportunities are only stored with the check of a completed tick
+        store.record_check(time.time(), alerted)
 
         logger.info("Arbitrage check completed successfully")
 
     except Exception as e:
         logger.error(f"Error during arbitrage check: {e}", exc_info=True)
+        # Spreads of an incomplete tick must not be served as live
+        opportunity_index.clear()
 
 
 def run_arbitrage_check() -> None:
@@ -1,14 +1,16 @@
 """Module defines recurring tasks for nobitex trading operations."""
 
-from typing import Optional
-
+from config.base import settings
 from src.tasks.utils import format_nobitex_trades
 from toolkit.clients import get_nobitex_client
+from toolkit.quotes import Quote
 
 
-def run_nobitex_trades_retrieval() -> dict[str, dict[str, Optional[float]]]:
+def run_nobitex_trades_retrieval() -> dict[str, Quote]:
     """Run the trade retrieval process for Nobitex."""
     client = get_nobitex_client()
+    if settings.STREAM_DECODE:
+        return client.get_latest_quotes()
     response = client.get_trades()
     formatted_trades = format_nobitex_trades(response)
     return formatted_trades
@@ -1,6 +1,8 @@
 """Module defines utilities for scheduled tasks."""
 
-from typing import Any, Optional
+from typing import Any
+
+from toolkit.quotes import Quote
 
 
 def calculate_profit(buy_price: float, sell_price: float) -> tuple[float, float]:
@@ -26,7 +28,7 @@ def calculate_profit(buy_price: float, sell_price: float) -> tuple[float, float]
 
 def format_nobitex_trades(
     nobitex_response: dict[str, Any],
-) -> dict[str, dict[str, Optional[float]]]:
+) -> dict[str, Quote]:
     """
     Format Nobitex API response.
 
@@ -37,17 +39,14 @@ def format_nobitex_trades(
 
     Returns
     -------
-    Dict[str, Dict[str, Optional[float]]]
-        A dictionary with currency keys and their latest buy/sell prices.
+    Dict[str, Quote]
+        A dictionary with currency keys and their latest buy/sell quotes.
     """
-    formatted_data = {}
+    formatted_data: dict[str, Quote] = {}
 
     for currency_key, currency_data in nobitex_response.items():
         if currency_data.get("status") != "ok" or not currency_data.get("trades"):
-            formatted_data[currency_key] = {
-                "latest_buy_price": None,
-                "latest_sell_price": None,
-            }
+            formatted_data[currency_key] = Quote(currency_key)
             continue
 
         trades = currency_data["trades"]
@@ -63,17 +62,16 @@ def format_nobitex_trades(
             if latest_buy_price is not None and latest_sell_price is not None:
                 break
 
-        formatted_data[currency_key] = {
-            "latest_buy_price": latest_buy_price,
-            "latest_sell_price": latest_sell_price,
-        }
+        formatted_data[currency_key] = Quote(
+            currency_key, latest_buy_price, latest_sell_price
+        )
 
     return formatted_data
 
 
 def format_wallex_trades(
     wallex_response: dict[str, Any],
-) -> dict[str, dict[str, Optional[float]]]:
+) -> dict[str, Quote]:
     """
     Format Wallex API response.
 
@@ -84,19 +82,16 @@ def format_wallex_trades(
 
     Returns
     -------
-    dict[str, dict[str, Optional[float]]]
-        A dictionary with currency keys and their latest buy/sell prices.
+    dict[str, Quote]
+        A dictionary with currency keys and their latest buy/sell quotes.
     """
-    formatted_data = {}
+    formatted_data: dict[str, Quote] = {}
 
     for currency_key, currency_data in wallex_response.items():
         if not currency_data.get("success") or not currency_data.get("result", {}).get(
             "latestTrades"
         ):
-            formatted_data[currency_key] = {
-                "latest_buy_price": None,
-                "latest_sell_price": None,
-            }
+            formatted_data[currency_key] = Quote(currency_key)
             continue
 
         trades = currency_data["result"]["latestTrades"]
@@ -112,9 +107,8 @@ def format_wallex_trades(
             if latest_buy_price is not None and latest_sell_price is not None:
                 break
 
-        formatted_data[currency_key] = {
-            "latest_buy_price": latest_buy_price,
-            "latest_sell_price": latest_sell_price,
-        }
+        formatted_data[currency_key] = Quote(
+            currency_key, latest_buy_price, latest_sell_price
+        )
 
     return formatted_data
@@ -1,14 +1,16 @@
 """Module defines recurring tasks for Wallex trading operations."""
 
-from typing import Optional
-
+from config.base import settings
 from src.tasks.utils import format_wallex_trades
 from toolkit.clients import get_wallex_client
+from toolkit.quotes import Quote
 
 
-def run_wallex_trades_retrieval() -> dict[str, dict[str, Optional[float]]]:
+def run_wallex_trades_retrieval() -> dict[str, Quote]:
     """Run the trade retrieval process for Wallex."""
     client = get_wallex_client()
+    if settings.STREAM_DECODE:
+        return client.get_latest_quotes()
     response = client.get_trades()
     formatted_trades = format_wallex_trades(response)
     return formatted_trades
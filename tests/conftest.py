@@ -0,0 +1,13 @@
+"""Module configures the test environment."""
+
+import os
+
+os.environ.setdefault("NOBITEX_GATEWAY", "https://nobitex.test")
+os.environ.setdefault("NOBITEX_TRADES_ENDPOINT", "/v2/trades/{currency_id}")
+os.environ.setdefault("WALLEX_GATEWAY", "https://wallex.test")
+os.environ.setdefault("WALLEX_TRADES_ENDPOINT", "/v1/trades")
+os.environ.setdefault("WALLEX_API_KEY", "test")
+os.environ.setdefault("THRESHOLD", "0.5")
+os.environ.setdefault("BOT_API_TOKEN", "test")
+os.environ.setdefault("DM_CHAT_ID", "0")
+os.environ.setdefault("SEND_MESSAGE_URL", "https://telegram.test/{BOT_API_TOKEN}")
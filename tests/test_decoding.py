@@ -0,0 +1,97 @@
+"""Module tests streaming extraction against the full-decode formatters."""
+
+import json
+
+import pytest
+
+from src.tasks.utils import format_nobitex_trades, format_wallex_trades
+from toolkit.clients.decoding import extract_latest_prices
+from toolkit.clients.nobitex import NobitexClient
+from toolkit.clients.wallex import WallexClient
+
+
+def _nobitex_trade(price: str, side: str) -> dict:
+    return {"time": 1, "price": price, "volume": "0.1", "type": side}
+
+
+def _wallex_trade(price: str, is_buy) -> dict:
+    return {"symbol": "BTCUSDT", "price": price, "isBuyOrder": is_buy}
+
+
+NOBITEX_PAYLOADS = [
+    {
+        "status": "ok",
+        "trades": [_nobitex_trade("1", "sell"), _nobitex_trade("2", "buy")],
+    },
+    {
+        "status": "ok",
+        "trades": [_nobitex_trade("1", "sell"), _nobitex_trade("3", "sell")],
+    },
+    {"status": "ok", "trades": []},
+    {"status": "failed", "trades": [_nobitex_trade("1", "buy")]},
+    {"trades": [_nobitex_trade("1", "buy")], "status": "ok"},
+    {
+        "trades": [_nobitex_trade("1", "buy")],
+        "status": "failed",
+        "meta": {"status": "ok"},
+    },
+    {"trades": [_nobitex_trade("1", "buy")], "meta": {"status": "ok"}},
+    {"status": "failed", "message": "status"},
+]
+
+WALLEX_PAYLOADS = [
+    {
+        "result": {
+            "latestTrades": [_wallex_trade("5", False), _wallex_trade("6", True)]
+        },
+        "message": "ok",
+        "success": True,
+    },
+    {
+        "result": {"latestTrades": [_wallex_trade("5", 0), _wallex_trade("6", 1)]},
+        "success": True,
+    },
+    {"success": True, "result": {"latestTrades": [_wallex_trade("7", True)]}},
+    {"result": {"latestTrades": [_wallex_trade("5", True)]}, "success": False},
+    {"result": {"latestTrades": []}, "success": True},
+    {
+        "result": {"latestTrades": [_wallex_trade("5", True)], "success": True},
+        "success": False,
+    },
+]
+
+
+def _quote_prices(quote) -> tuple:
+    return quote.latest_buy_price, quote.latest_sell_price
+
+
+@pytest.mark.parametrize("payload", NOBITEX_PAYLOADS)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_nobitex_extraction_matches_formatter(payload, indent):
+    expected = format_nobitex_trades({"BTCUSDT": payload})["BTCUSDT"]
+    text = json.dumps(payload, indent=indent)
+    assert extract_latest_prices(text, NobitexClient.trades_format) == _quote_prices(
+        expected
+    )
+
+
+@pytest.mark.parametrize("payload", WALLEX_PAYLOADS)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_wallex_extraction_matches_formatter(payload, indent):
+    expected = format_wallex_trades({"BTCUSDT": payload})["BTCUSDT"]
+    text = json.dumps(payload, indent=indent)
+    assert extract_latest_prices(text, WallexClient.trades_format) == _quote_prices(
+        expected
+    )
+
+
+def test_extraction_stops_after_both_prices():
+    trades = [_nobitex_trade("1", "sell"), _nobitex_trade("2", "buy")]
+    text = json.dumps({"status": "ok", "trades": trades})[:-2] + ", {broken"
+    assert extract_latest_prices(text, NobitexClient.trades_format) == (2.0, 1.0)
+
+
+def test_extraction_rejects_malformed_array():
+    text = '{"status": "ok", "trades": [{"price": "1", "type": "sell"} {}]}'
+    with pytest.raises(ValueError):
+        extract_latest_prices(text, NobitexClient.trades_format)
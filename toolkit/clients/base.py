@@ -1,15 +1,61 @@
 """Module contains base clients for the application."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import requests
+
+from config.base import CURRENCY_SYMBOLS, logger
+from src.monitoring.ctx_manager import APITimer
+from toolkit.quotes import Quote
+
+from .decoding import TradesFormat, extract_latest_prices, loads
+
+T = TypeVar("T")
 
 
 class BaseClient(ABC):
     """Base client for all API clients."""
 
+    exchange: str
+    trades_format: TradesFormat
+
     def __init__(self, base_url: str):
         self.base_url = base_url
 
     @abstractmethod
-    def get_trades(self):
-        """Get all trades from the API."""
+    def _request_trades(self, symbol: str) -> requests.Response:
+        """Request the latest trades of a symbol from the API."""
         pass
+
+    def _fetch_all(self, parse: Callable[[str, requests.Response], T]) -> dict[str, T]:
+        """Fetch trades of every currency and parse each response."""
+        responses = {}
+        for key in CURRENCY_SYMBOLS:
+            with APITimer(self.exchange, key) as timer:
+                try:
+                    response = self._request_trades(key)
+                    response.raise_for_status()
+                    responses[key] = parse(key, response)
+                    timer.mark_success()
+                except (requests.RequestException, ValueError) as e:
+                    logger.error(
+                        f"Error fetching {key} trades from {self.exchange}: {e}"
+                    )
+        return responses
+
+    def get_trades(self) -> dict[str, dict[str, Any]]:
+        """Get all trades from the API."""
+        return self._fetch_all(lambda key, response: loads(response.content))
+
+    def get_latest_quotes(self) -> dict[str, Quote]:
+        """Get latest buy/sell quotes from the API without full decoding."""
+        return self._fetch_all(self._parse_quote)
+
+    def _parse_quote(self, key: str, response: requests.Response) -> Quote:
+        """Extract the latest quote from a raw trades response."""
+        latest_buy_price, latest_sell_price = extract_latest_prices(
+            response.text, self.trades_format
+        )
+        return Quote(key, latest_buy_price, latest_sell_price)
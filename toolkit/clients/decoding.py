@@ -0,0 +1,219 @@
+"""Module contains JSON decoding helpers for API clients."""
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode a JSON document using the fastest available backend.
+
+    Parameters
+    ----------
+    data : bytes | str
+        The raw JSON document.
+
+    Returns
+    -------
+    Any
+        The decoded document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class TradesFormat:
+    """Layout of an exchange trades response."""
+
+    __slots__ = ("path", "side_key", "buy_value", "sell_value", "ok_key", "is_ok")
+
+    def __init__(
+        self,
+        path: tuple[str, ...],
+        side_key: str,
+        buy_value: Any,
+        sell_value: Any,
+        ok_key: str,
+        is_ok: Callable[[Any], bool],
+    ):
+        self.path = path
+        self.side_key = side_key
+        self.buy_value = buy_value
+        self.sell_value = sell_value
+        self.ok_key = ok_key
+        self.is_ok = is_ok
+
+    def is_buy(self, side: Any) -> bool:
+        """Check whether a trade side marks a buy trade."""
+        return _side_matches(side, self.buy_value)
+
+    def is_sell(self, side: Any) -> bool:
+        """Check whether a trade side marks a sell trade."""
+        return _side_matches(side, self.sell_value)
+
+
+def _side_matches(side: Any, expected: Any) -> bool:
+    """Compare a trade side, by identity for booleans like the formatters do."""
+    if isinstance(expected, bool):
+        return side is expected
+    return side == expected
+
+
+def _skip(text: str, pos: int) -> int:
+    """Skip JSON whitespace."""
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    """Consume a structural character and the whitespace after it."""
+    if not text.startswith(char, pos):
+        raise ValueError(f"Expected {char!r} at position {pos}")
+    return _skip(text, pos + 1)
+
+
+def _find_array(
+    text: str, path: tuple[str, ...]
+) -> tuple[Optional[int], dict[str, Any]]:
+    """
+    Walk objects along a key path up to the opening of an array.
+
+    Members preceding the path are decoded on the way, so top-level fields
+    that come before the array are available without a second pass.
+
+    Returns
+    -------
+    tuple[Optional[int], dict[str, Any]]
+        Position right after the array opening bracket, or None if the path
+        does not lead to an array, and the top-level members decoded so far.
+    """
+    leading: dict[str, Any] = {}
+    pos = _skip(text, 0)
+    for depth, key in enumerate(path):
+        if not text.startswith("{", pos):
+            return None, leading
+        pos = _skip(text, pos + 1)
+        while True:
+            if text.startswith("}", pos):
+                return None, leading
+            member, pos = _decoder.raw_decode(text, pos)
+            pos = _expect(text, _skip(text, pos), ":")
+            if member == key:
+                break
+            value, pos = _decoder.raw_decode(text, pos)
+            if depth == 0:
+                leading[member] = value
+            pos = _skip(text, pos)
+            if text.startswith(",", pos):
+                pos = _skip(text, pos + 1)
+    if not text.startswith("[", pos):
+        return None, leading
+    return _skip(text, pos + 1), leading
+
+
+def _trailing_member(text: str, key: str) -> tuple[bool, Any]:
+    """
+    Find a top-level member located after the trades array.
+
+    Candidates are searched from the end of the document and accepted only
+    if the remaining members close the top-level object, which keeps both
+    the cost and the match confined to the document tail.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        Whether the member was found and its value.
+    """
+    needle = json.dumps(key)
+    end = len(text)
+    while True:
+        index = text.rfind(needle, 0, end)
+        if index == -1:
+            return False, None
+        end = index
+        try:
+            pos = _expect(text, _skip(text, index + len(needle)), ":")
+            value, pos = _decoder.raw_decode(text, pos)
+            pos = _skip(text, pos)
+            while text.startswith(",", pos):
+                pos = _skip(text, pos + 1)
+                _, pos = _decoder.raw_decode(text, pos)
+                pos = _expect(text, _skip(text, pos), ":")
+                _, pos = _decoder.raw_decode(text, pos)
+                pos = _skip(text, pos)
+            if _skip(text, _expect(text, pos, "}")) == len(text):
+                return True, value
+        except ValueError:
+            continue
+
+
+def extract_latest_prices(
+    text: str, trades_format: TradesFormat
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Extract the first buy and sell prices from a trades response.
+
+    Trades are decoded one by one and parsing stops as soon as both prices
+    are found, so the tail of long trade lists is never turned into objects.
+    The response is only accepted if its top-level status member is ok.
+
+    Parameters
+    ----------
+    text : str
+        The raw JSON response body.
+    trades_format : TradesFormat
+        Layout of the response.
+
+    Returns
+    -------
+    tuple[Optional[float], Optional[float]]
+        The latest buy and sell prices.
+
+    Raises
+    ------
+    ValueError
+        If the response is malformed.
+    """
+    latest_buy_price = None
+    latest_sell_price = None
+
+    pos, leading = _find_array(text, trades_format.path)
+    ok_key = trades_format.ok_key
+    if ok_key in leading and not trades_format.is_ok(leading[ok_key]):
+        return None, None
+    if pos is None:
+        return None, None
+
+    while not text.startswith("]", pos):
+        trade, pos = _decoder.raw_decode(text, pos)
+        side = trade.get(trades_format.side_key)
+        if trades_format.is_buy(side) and latest_buy_price is None:
+            latest_buy_price = float(trade["price"])
+        elif trades_format.is_sell(side) and latest_sell_price is None:
+            latest_sell_price = float(trade["price"])
+
+        if latest_buy_price is not None and latest_sell_price is not None:
+            break
+
+        pos = _skip(text, pos)
+        if text.startswith(",", pos):
+            pos = _skip(text, pos + 1)
+        elif not text.startswith("]", pos):
+            raise ValueError(f"Malformed trades array at position {pos}")
+
+    if ok_key not in leading:
+        found, value = _trailing_member(text, ok_key)
+        if not found or not trades_format.is_ok(value):
+            return None, None
+
+    return latest_buy_price, latest_sell_price
@@ -1,35 +1,29 @@
 """Module contains Nobitex API client."""
 
-from typing import Any
-
 import requests
 
-from config.base import CURRENCY_SYMBOLS, logger, settings
-from src.monitoring.ctx_manager import APITimer
+from config.base import settings
 
 from .base import BaseClient
+from .decoding import TradesFormat
 
 
 class NobitexClient(BaseClient):
     """Nobitex API client."""
 
-    def get_trades(self) -> dict[str, dict[str, Any]]:
-        """Get all trades from Nobitex API."""
-        currency_urls = [
-            self.base_url + settings.get_nobitex_currency_url(symbol)
-            for symbol in CURRENCY_SYMBOLS
-        ]
-        responses = {}
-        for key, url in zip(CURRENCY_SYMBOLS, currency_urls):
-            with APITimer("nobitex", key) as timer:
-                try:
-                    response = requests.get(url)
-                    response.raise_for_status()
-                    responses[key] = response.json()
-                    timer.mark_success()
-                except requests.RequestException as e:
-                    logger.error(f"Error fetching {key} trades from nobitex: {e}")
-        return responses
+    exchange = "nobitex"
+    trades_format = TradesFormat(
+        path=("trades",),
+        side_key="type",
+        buy_value="buy",
+        sell_value="sell",
+        ok_key="status",
+        is_ok=lambda status: status == "ok",
+    )
+
+    def _request_trades(self, symbol: str) -> requests.Response:
+        """Request the latest trades of a symbol from Nobitex API."""
+        return requests.get(self.base_url + settings.get_nobitex_currency_url(symbol))
 
 
 def get_nobitex_client() -> NobitexClient:
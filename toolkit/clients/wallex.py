@@ -1,39 +1,37 @@
 """Module contains wallex API client."""
 
-from typing import Any
-
 import requests
 
-from config.base import CURRENCY_SYMBOLS, logger, settings
-from src.monitoring.ctx_manager import APITimer
+from config.base import settings
 
 from .base import BaseClient
+from .decoding import TradesFormat
 
 
 class WallexClient(BaseClient):
     """Wallex API client."""
 
+    exchange = "wallex"
+    trades_format = TradesFormat(
+        path=("result", "latestTrades"),
+        side_key="isBuyOrder",
+        buy_value=True,
+        sell_value=False,
+        ok_key="success",
+        is_ok=bool,
+    )
+
     def __init__(self, base_url):
         super().__init__(base_url)
         self.api_key = settings.WALLEX_API_KEY
 
-    def get_trades(self) -> dict[str, dict[str, Any]]:
-        """Get all trades from Wallex API."""
-        headers = {"x-api-key": self.api_key}
-        responses = {}
-        for key in CURRENCY_SYMBOLS:
-            query_params = {"symbol": key}
-            with APITimer("wallex", key) as timer:
-                try:
-                    response = requests.get(
-                        self.base_url, headers=headers, params=query_params
-                    )
-                    response.raise_for_status()
-                    responses[key] = response.json()
-                    timer.mark_success()
-                except requests.RequestException as e:
-                    logger.error(f"Error fetching {key} trades from wallex: {e}")
-        return responses
+    def _request_trades(self, symbol: str) -> requests.Response:
+        """Request the latest trades of a symbol from Wallex API."""
+        return requests.get(
+            self.base_url,
+            headers={"x-api-key": self.api_key},
+            params={"symbol": symbol},
+        )
 
 
 def get_wallex_client() -> WallexClient:
@@ -0,0 +1,137 @@
+"""Module contains compact quote records shared across the pipeline."""
+
+import sys
+from typing import Any, Optional
+
+_SYMBOL_IDS: dict[str, int] = {}
+_SYMBOLS: list[str] = []
+
+
+def intern_symbol(symbol: str) -> int:
+    """
+    Get the interned id of a currency symbol, registering it if needed.
+
+    Parameters
+    ----------
+    symbol : str
+        The currency symbol (e.g., 'BTCUSDT').
+
+    Returns
+    -------
+    int
+        A small integer id that is stable for the lifetime of the process.
+    """
+    symbol_id = _SYMBOL_IDS.get(symbol)
+    if symbol_id is None:
+        symbol_id = len(_SYMBOLS)
+        _SYMBOLS.append(sys.intern(symbol))
+        _SYMBOL_IDS[_SYMBOLS[symbol_id]] = symbol_id
+    return symbol_id
+
+
+def symbol_name(symbol_id: int) -> str:
+    """Get the currency symbol for an interned id."""
+    return _SYMBOLS[symbol_id]
+
+
+class Quote:
+    """Latest buy and sell prices of a single symbol on one exchange."""
+
+    __slots__ = ("symbol_id", "latest_buy_price", "latest_sell_price")
+
+    def __init__(
+        self,
+        symbol: str,
+        latest_buy_price: Optional[float] = None,
+        latest_sell_price: Optional[float] = None,
+    ):
+        self.symbol_id = intern_symbol(symbol)
+        self.latest_buy_price = latest_buy_price
+        self.latest_sell_price = latest_sell_price
+
+    @property
+    def symbol(self) -> str:
+        """Get the currency symbol of the quote."""
+        return symbol_name(self.symbol_id)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare quotes by symbol and prices."""
+        if not isinstance(other, Quote):
+            return NotImplemented
+        return (
+            self.symbol_id == other.symbol_id
+            and self.latest_buy_price == other.latest_buy_price
+            and self.latest_sell_price == other.latest_sell_price
+        )
+
+    def __repr__(self) -> str:
+        """Get a readable representation of the quote."""
+        return (
+            f"Quote(symbol={self.symbol!r}, "
+            f"latest_buy_price={self.latest_buy_price!r}, "
+            f"latest_sell_price={self.latest_sell_price!r})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the quote as a JSON-serializable dictionary."""
+        return {
+            "currency": self.symbol,
+            "latest_buy_price": self.latest_buy_price,
+            "latest_sell_price": self.latest_sell_price,
+        }
+
+
+class Opportunity:
+    """Arbitrage opportunity detected between two exchanges."""
+
+    __slots__ = (
+        "symbol_id",
+        "direction",
+        "buy_price",
+        "sell_price",
+        "profit",
+        "profit_percentage",
+        "detected_at",
+    )
+
+    def __init__(
+        self,
+        currency: str,
+        direction: str,
+        buy_price: float,
+        sell_price: float,
+        profit: float,
+        profit_percentage: float,
+        detected_at: float,
+    ):
+        self.symbol_id = intern_symbol(currency)
+        self.direction = sys.intern(direction)
+        self.buy_price = buy_price
+        self.sell_price = sell_price
+        self.profit = profit
+        self.profit_percentage = profit_percentage
+        self.detected_at = detected_at
+
+    @property
+    def currency(self) -> str:
+        """Get the currency symbol of the opportunity."""
+        return symbol_name(self.symbol_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the opportunity as a JSON-serializable dictionary."""
+        return {
+            "currency": self.currency,
+            "direction": self.direction,
+            "buy_price": self.buy_price,
+            "sell_price": self.sell_price,
+            "profit": self.profit,
+            "profit_percentage": self.profit_percentage,
+            "detected_at": self.detected_at,
+        }
+
+    def __repr__(self) -> str:
+        """Get a readable representation of the opportunity."""
+        return (
+            f"Opportunity(currency={self.currency!r}, direction={self.direction!r}, "
+            f"profit_percentage={self.profit_percentage!r})"
+        )